@@ -1,9 +1,11 @@
 # SPDX-License-Identifier: GPL-3.0-only
+import copy
+import functools
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 
-import yaml
 from pydantic import AfterValidator, BaseModel, HttpUrl, ValidationError, model_validator
 from pydantic_core import ErrorDetails
 from pydantic_settings import (
@@ -17,6 +19,10 @@ from typing_extensions import Self
 from hermeto import APP_NAME
 from hermeto.core.constants import Mode
 from hermeto.core.errors import InvalidInput
+from hermeto.core.yaml_loader import safe_load_yaml
+
+if TYPE_CHECKING:
+    from importlib.abc import Traversable
 
 # Ascending priority
 CONFIG_FILE_PATHS = [
@@ -27,6 +33,10 @@ CONFIG_FILE_PATHS = [
 log = logging.getLogger(__name__)
 config = None
 
+_YAML_CACHE_MAX_SIZE = 100
+# (absolute path, encoding) -> (file signature, parsed data)
+_yaml_cache: OrderedDict[tuple[str, str | None], tuple[tuple[int, int, int], Any]] = OrderedDict()
+
 _FLAT_FIELD_MIGRATIONS = [
     ("allow_yarnberry_processing", ("yarn", "enabled")),
     ("ignore_pip_dependencies_crates", ("pip", "ignore_dependencies_crates")),
@@ -44,8 +54,9 @@ def _remove_gomod_strict_vendor(data: dict[str, Any]) -> None:
         data.pop("gomod_strict_vendor")
         log.warning(
             "The 'gomod_strict_vendor' config option is deprecated and no longer has any effect. "
-            f"{APP_NAME.capitalize()} will always check the vendored contents and fail if they "
-            "are not up-to-date. Please remove this option from your configuration."
+            "%s will always check the vendored contents and fail if they "
+            "are not up-to-date. Please remove this option from your configuration.",
+            APP_NAME.capitalize(),
         )
 
 
@@ -66,14 +77,59 @@ def _migrate_deprecated_field(
 
     if new_key not in data[namespace]:
         data[namespace][new_key] = value
-        log.warning(f"Config option '{old_key}' is deprecated. Please use '{new_path}' instead.")
+        log.warning("Config option '%s' is deprecated. Please use '%s' instead.", old_key, new_path)
     else:
         log.warning(
-            f"Both '{old_key}' and '{new_path}' are set. "
-            f"Using '{new_path}'. Please remove '{old_key}'."
+            "Both '%s' and '%s' are set. Using '%s'. Please remove '%s'.",
+            old_key,
+            new_path,
+            new_path,
+            old_key,
         )
 
 
+def _load_yaml_cached(path: Path, encoding: str | None = None) -> Any:
+    """Parse a YAML file, reusing the previous result if the file did not change since.
+
+    The same config files get parsed repeatedly: set_config() validates the CLI config file
+    before the settings sources read it again, and every Config() instantiation re-reads the
+    default config files. The returned data is a copy, because config validators mutate it.
+
+    Without an explicit encoding the file is read as bytes and the YAML parser detects it.
+    """
+    stat = path.stat()
+    key = (str(path.absolute()), encoding)
+    # A rewrite which keeps the inode and size within one mtime tick would go unnoticed.
+    # Config files are edited by hand between runs, so that is not a concern in practice.
+    signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    cached = _yaml_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        _yaml_cache.move_to_end(key)
+        return copy.deepcopy(cached[1])
+
+    with path.open("r", encoding=encoding) if encoding else path.open("rb") as f:
+        data = safe_load_yaml(f)
+    _yaml_cache[key] = (signature, data)
+    _yaml_cache.move_to_end(key)
+    if len(_yaml_cache) > _YAML_CACHE_MAX_SIZE:
+        _yaml_cache.popitem(last=False)
+
+    return copy.deepcopy(data)
+
+
+class _CachedYamlConfigSettingsSource(YamlConfigSettingsSource):
+    """YAML settings source which parses files through the shared YAML cache."""
+
+    # Shadows the upstream private hook, keep the signature and encoding handling in sync
+    # with pydantic-settings when upgrading it.
+    def _read_file(self, file_path: "Path | Traversable") -> dict[str, Any]:
+        if not isinstance(file_path, Path):
+            # package resources cannot be stat()-ed, leave those to upstream
+            return super()._read_file(file_path)
+        return _load_yaml_cached(file_path, self.yaml_file_encoding) or {}
+
+
 def _proxy_url_must_not_contain_credentials(url: HttpUrl | None) -> HttpUrl | None:
     if url is None:
         return None
@@ -273,18 +329,21 @@ class Config(BaseSettings):
         return (
             init_settings,
             env_settings,
-            YamlConfigSettingsSource(
+            _CachedYamlConfigSettingsSource(
                 settings_cls
             ),  # The CLI config path from yaml_file in model_config
-            YamlConfigSettingsSource(settings_cls, CONFIG_FILE_PATHS),
+            _CachedYamlConfigSettingsSource(settings_cls, CONFIG_FILE_PATHS),
         )
 
 
+@functools.lru_cache(maxsize=8)
 def create_cli_config_class(config_path: Path) -> type[Config]:
     """Return a subclass of Config that uses the CLI YAML file input.
 
     This is necessary because the path of the YAML config file from the CLI is not known
     ahead of time: https://github.com/pydantic/pydantic-settings/issues/259
+
+    The class is cached per path, building a pydantic model class (and its schema) is costly.
     """
 
     class CLIConfig(Config):
@@ -341,7 +400,7 @@ def set_config(path: Path) -> Config:
     global config
     # Validate beforehand for a friendlier error message: https://github.com/pydantic/pydantic-settings/pull/432
     try:
-        Config.model_validate(yaml.safe_load(path.read_text()))
+        Config.model_validate(_load_yaml_cached(path))
     except ValidationError as e:
         raise InvalidInput(_present_config_error(e)) from e
 
@@ -24,6 +24,7 @@ log = logging.getLogger(__name__)
 
 GEMFILE = "Gemfile"
 GEMFILE_LOCK = "Gemfile.lock"
+LOCKFILE_PARSER = Path(__file__).parent / "scripts" / "lockfile_parser.rb"
 
 
 BundlerDependency = GemDependency | GemPlatformSpecificDependency | GitDependency | PathDependency
@@ -62,14 +63,11 @@ def _run_lockfile_parser(package_dir: Path) -> dict[str, Any]:
     """
     Run the lockfile parser script and return the parsed output as JSON.
     """
-    scripts_dir = Path(__file__).parent / "scripts"
-    lockfile_parser = scripts_dir / "lockfile_parser.rb"
-
     # Ensure that no Bundler environment variables can affect the parser execution.
     env = {"PATH": os.environ.get("PATH")}
     with _with_hidden_bundle_directory(package_dir):
         try:
-            output = run_cmd(cmd=[str(lockfile_parser)], params={"cwd": package_dir, "env": env})
+            output = run_cmd(cmd=[str(LOCKFILE_PARSER)], params={"cwd": package_dir, "env": env})
         except subprocess.CalledProcessError as e:
             raise PackageManagerError("Failed to parse Gemfile.lock") from e
 
@@ -89,10 +87,11 @@ def parse_lockfile(
 
     result: ParseResult = []
     for dep in dependencies:
-        if dep["type"] == "rubygems":
+        dep_type = dep["type"]
+        if dep_type == "rubygems":
             for platform in dep["platforms"]:
                 if platform == "ruby":
-                    result.append(GemDependency(**dep))
+                    result.append(GemDependency.model_validate(dep))
                 else:
                     full_name = "-".join([dep["name"], dep["version"], platform])
                     log.info("Found a binary dependency %s", full_name)
@@ -101,7 +100,11 @@ def parse_lockfile(
                             "Will download binary dependency %s because 'binary' field is set",
                             full_name,
                         )
-                        result.append(GemPlatformSpecificDependency(platform=platform, **dep))
+                        result.append(
+                            GemPlatformSpecificDependency.model_validate(
+                                {**dep, "platform": platform}
+                            )
+                        )
                     else:
                         # No need to force a platform if we skip the packages.
                         log.warning(
@@ -109,9 +112,9 @@ def parse_lockfile(
                             " This will likely result in an unbuildable package.",
                             full_name,
                         )
-        elif dep["type"] == "git":
-            result.append(GitDependency(**dep))
-        elif dep["type"] == "path":
-            result.append(PathDependency(**dep, root=package_dir))
+        elif dep_type == "git":
+            result.append(GitDependency.model_validate(dep))
+        elif dep_type == "path":
+            result.append(PathDependency.model_validate({**dep, "root": package_dir}))
 
     return result
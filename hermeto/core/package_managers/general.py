@@ -30,7 +30,7 @@ _pkg_requests_session: requests.Session | None = None
 SAFE_REQUEST_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "TRACE"})
 BACKOFF_FACTOR = 1.3
 STATUS_FORCELIST = (500, 502, 503, 504)
-DEFAULT_CHUNK_SIZE = 65536  # 64KB
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1MiB
 
 log = logging.getLogger(__name__)
 
@@ -149,6 +149,7 @@ async def _async_download_binary_file(
     headers: dict[str, str] | None = None,
     ssl_context: ssl.SSLContext | None = None,
     chunk_size: int = DEFAULT_CHUNK_SIZE,
+    timeout: aiohttp.ClientTimeout | None = None,
 ) -> None:
     """
     Download a binary file (such as a TAR archive) from a URL using asyncio.
@@ -158,9 +159,11 @@ async def _async_download_binary_file(
     :param str download_path: File path location
     :param headers: Optional headers dict for this request.
     :param int chunk_size: Max size of each chunk to read from the response
+    :param timeout: Timeout configuration, built from the config if not provided
     :raise FetchError: If download failed
     """
-    timeout = _get_aiohttp_timeout()
+    if timeout is None:
+        timeout = _get_aiohttp_timeout()
     log.debug("Downloading %s", url)
 
     try:
@@ -258,37 +261,38 @@ async def async_download_files(
         requote_redirect_url=False,
     )
 
+    # The same for every file in the batch
+    timeout = _get_aiohttp_timeout()
+
     async with retry_client as session:
-        tasks: set[asyncio.Task] = set()
-
-        for url, download_path in files_to_download.items():
-            if len(tasks) >= concurrency_limit:
-                # Wait for some download to finish before adding a new one
-                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
-                # Check for exceptions
-                try:
-                    await asyncio.gather(*done)
-                except FetchError:
-                    # Close retry_client if any request fails (other tasks can be running,
-                    # if a task is closed with the client open, an Warning is raised).
-                    await retry_client.close()
-                    for t in tasks:
-                        t.cancel()
-                    raise
-
-            tasks.add(
-                asyncio.create_task(
-                    _async_download_binary_file(
-                        session,
-                        url,
-                        download_path,
-                        ssl_context=ssl_context,
-                        headers=headers.get(url) if headers else None,
-                    )
+        # A free slot is taken by the next pending download as soon as any download
+        # finishes, rather than admitting new downloads in batches.
+        semaphore = asyncio.Semaphore(concurrency_limit)
+
+        async def download_with_limit(url: str, download_path: StrPath) -> None:
+            async with semaphore:
+                await _async_download_binary_file(
+                    session,
+                    url,
+                    download_path,
+                    ssl_context=ssl_context,
+                    headers=headers.get(url) if headers else None,
+                    timeout=timeout,
                 )
-            )
 
-        await asyncio.gather(*tasks)
+        tasks = [
+            asyncio.create_task(download_with_limit(url, download_path))
+            for url, download_path in files_to_download.items()
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # Stop the remaining downloads and let them unwind before the session is closed,
+            # otherwise aiohttp warns about requests left running on a closed client.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
 
 def get_vcs_qualifiers(path_root: StrPath) -> dict[str, str]:
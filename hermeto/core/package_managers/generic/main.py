@@ -16,6 +16,7 @@ from hermeto.core.models.sbom import Component, create_backend_annotation
 from hermeto.core.package_managers.general import async_download_files
 from hermeto.core.package_managers.generic.models import GenericLockfile, GenericLockfileAdapter
 from hermeto.core.rooted_path import RootedPath
+from hermeto.core.yaml_loader import safe_load_yaml
 
 log = logging.getLogger(__name__)
 DEFAULT_LOCKFILE_NAME = "artifacts.lock.yaml"
@@ -104,10 +105,12 @@ def _resolve_generic_lockfile(lockfile_path: Path, output_dir: RootedPath) -> li
         )
     )
 
-    # verify checksums
+    # verify checksums and collect the SBOM components in a single pass
+    components = []
     for artifact in lockfile.artifacts:
         must_match_any_checksum(artifact.filename, [artifact.formatted_checksum])
-    return [artifact.get_sbom_component() for artifact in lockfile.artifacts]
+        components.append(artifact.get_sbom_component())
+    return components
 
 
 def _load_lockfile(lockfile_path: Path, output_dir: RootedPath) -> GenericLockfile:
@@ -117,9 +120,9 @@ def _load_lockfile(lockfile_path: Path, output_dir: RootedPath) -> GenericLockfi
     :param lockfile_path: the path to the lockfile
     :param output_dir: path to output directory
     """
-    with open(lockfile_path) as f:
+    with open(lockfile_path, "rb") as f:
         try:
-            lockfile_data = yaml.safe_load(f)
+            lockfile_data = safe_load_yaml(f)
         except yaml.YAMLError as e:
             raise InvalidLockfileFormat(
                 lockfile_path=lockfile_path,
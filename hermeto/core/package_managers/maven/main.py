@@ -1,7 +1,9 @@
 # SPDX-License-Identifier: GPL-3.0-only
 import asyncio
+from collections import defaultdict
 from collections.abc import Iterable
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
 from urllib.parse import urlparse
 
 from packageurl import PackageURL
@@ -19,6 +21,8 @@ from hermeto.core.package_managers.maven.models import (
 )
 
 MIRROR_ID = "hermeto-local"
+# Artifacts are often tens of MB, bigger chunks mean fewer reads than the 10KiB default
+_CHECKSUM_CHUNK_SIZE = 1024 * 1024  # 1MiB
 # https://maven.apache.org/settings.html
 SETTINGS_XML_TEMPLATE = f"""\
 <?xml version="1.0" encoding="UTF-8"?>
@@ -118,27 +122,26 @@ def _generate_main_component(lockfile: MavenLockfile) -> Component:
     return Component(name=artifact_id, purl=purl.to_string(), version=version)
 
 
-def _create_artifact_dir(deps_dir: Path, artifact: MavenArtifact) -> Path:
-    """Create a directory for the Maven artifact to download."""
-    artifact_dir_abs_path = deps_dir / artifact.artifact_relative_dir
-    # Some artifacts can share the relative directory (e.g. main JAR + classified JAR).
-    artifact_dir_abs_path.mkdir(parents=True, exist_ok=True)
-    return artifact_dir_abs_path / artifact.filename
-
-
 def _download_maven_artifacts(deps_dir: Path, artifacts: Iterable[MavenArtifact]) -> None:
     """Download Maven artifacts."""
-    download_paths = {a.url: _create_artifact_dir(deps_dir, a) for a in artifacts}
+    download_paths = {a.url: deps_dir / a.artifact_relative_dir / a.filename for a in artifacts}
+    # Some artifacts can share the relative directory (e.g. main JAR + classified JAR).
+    for artifact_dir in {path.parent for path in download_paths.values()}:
+        artifact_dir.mkdir(parents=True, exist_ok=True)
+
     pom_files = _get_matching_pom_files(deps_dir, artifacts)
 
     async def download_all() -> None:
         config = get_config()
         concurrency_limit = config.runtime.concurrency_limit
         await async_download_files(download_paths, concurrency_limit)
-        await async_download_files(pom_files, concurrency_limit)
+        # POMs have no checksums to verify, fetch them while the artifacts are being hashed
+        await asyncio.gather(
+            async_download_files(pom_files, concurrency_limit),
+            _verify_checksums(artifacts, download_paths),
+        )
 
     asyncio.run(download_all())
-    _verify_checksums(artifacts, download_paths)
     _write_checksums_files(artifacts, download_paths)
     _write_remote_repositories_files(deps_dir, artifacts)
 
@@ -150,10 +153,12 @@ def _get_matching_pom_files(deps_dir: Path, artifacts: Iterable[MavenArtifact])
     jars = (a for a in artifacts if a.url.endswith(".jar"))
     for jar in jars:
         parsed_url = urlparse(jar.url)
-        url_path = Path(parsed_url.path)
+        url_path = PurePosixPath(parsed_url.path)
 
         new_filename = f"{jar.artifact_id}-{jar.version}.pom"
-        pom_file_url = jar.url.replace(url_path.name, new_filename)
+        # Only the last path segment, the JAR name can show up elsewhere in the URL too
+        pom_url_path = str(url_path.with_name(new_filename))
+        pom_file_url = parsed_url._replace(path=pom_url_path).geturl()
 
         artifact_dir = deps_dir / jar.artifact_relative_dir
         poms[pom_file_url] = artifact_dir / new_filename
@@ -161,14 +166,32 @@ def _get_matching_pom_files(deps_dir: Path, artifacts: Iterable[MavenArtifact])
     return poms
 
 
-def _verify_checksums(artifacts: Iterable[MavenArtifact], download_paths: dict[str, Path]) -> None:
-    """Verify checksums of all Maven artifacts."""
-    for artifact in artifacts:
-        download_path = download_paths[artifact.url]
-        must_match_any_checksum(
-            download_path,
-            [ChecksumInfo(artifact.checksum_algorithm, artifact.checksum)],
-        )
+async def _verify_checksums(
+    artifacts: Iterable[MavenArtifact], download_paths: dict[str, Path]
+) -> None:
+    """Verify checksums of all Maven artifacts.
+
+    Files are hashed in worker threads, hashlib releases the GIL while digesting the chunks.
+    The threads are not taken from the default executor: aiofiles writes downloaded files
+    through it, and queueing every hash job there would stall concurrent downloads.
+    """
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=get_config().runtime.concurrency_limit)
+    try:
+        tasks = [
+            loop.run_in_executor(
+                executor,
+                must_match_any_checksum,
+                download_paths[artifact.url],
+                [ChecksumInfo(artifact.checksum_algorithm, artifact.checksum)],
+                _CHECKSUM_CHUNK_SIZE,
+            )
+            for artifact in artifacts
+        ]
+        await asyncio.gather(*tasks)
+    finally:
+        # After a mismatch the queued jobs are pointless, don't block the event loop on them
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 def _write_checksums_files(
@@ -182,8 +205,15 @@ def _write_checksums_files(
 
 
 def _write_remote_repositories_files(deps_dir: Path, artifacts: Iterable[MavenArtifact]) -> None:
-    """Write a _remote.repositories file for each Maven artifact."""
+    """Write a _remote.repositories file for each Maven artifact directory."""
+    # Artifacts sharing a directory (e.g. main JAR + classified JAR) share the file as well.
+    # Artifacts that differ only in their checksum share a filename, a set drops the duplicate.
+    lines_by_dir: defaultdict[Path, set[str]] = defaultdict(set)
     for artifact in artifacts:
         artifact_dir_abs_path = deps_dir / artifact.artifact_relative_dir
+        lines_by_dir[artifact_dir_abs_path].add(f"{artifact.filename}>{MIRROR_ID}=\n")
+
+    for artifact_dir_abs_path, lines in lines_by_dir.items():
         remote_repos_file = artifact_dir_abs_path.joinpath("_remote.repositories")
-        remote_repos_file.write_text(f"{artifact.filename}>{MIRROR_ID}=\n")
+        # sorted, artifacts usually come from a set and the output should be reproducible
+        remote_repos_file.write_text("".join(sorted(lines)))
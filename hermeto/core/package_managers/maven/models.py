@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: GPL-3.0-only
 import json
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
@@ -102,49 +103,47 @@ def _convert_java_checksum_algorithm_to_hashlib(java_algorithm: str) -> str:
     return java_algorithm.replace("-", "").lower()
 
 
-def _extract_pom_chain(pom: dict[str, Any] | None, result: list[MavenArtifact]) -> None:
-    """Recursively extract other Maven artifacts from the given POM."""
-    if not pom or not isinstance(pom, dict):
-        return
-
-    result.append(MavenArtifact.model_validate(pom))
-    _extract_pom_chain(pom.get("parent"), result)
-    for bom in pom.get("boms", []):
-        _extract_pom_chain(bom, result)
+def _extract_artifacts(artifacts: Iterable[dict[str, Any]], result: list[MavenArtifact]) -> None:
+    """Extract the given artifacts and all other Maven artifacts they reference.
 
+    Artifacts reference their POM chain (parents and BOMs), children and dependencies. The tree
+    is walked with an explicit stack because dependency trees can nest deeper than the recursion
+    limit allows. Nodes are visited in the same order as a recursive pre-order walk would.
+    """
+    # (node, whether it is an artifact rather than a POM from a parent/BOM chain)
+    stack: list[tuple[Any, bool]] = [(artifact, True) for artifact in reversed(list(artifacts))]
 
-def _extract_artifact(artifact: dict[str, Any], result: list[MavenArtifact]) -> None:
-    """Recursively extract other Maven artifacts from the given artifact."""
-    result.append(MavenArtifact.model_validate(artifact))
-    _extract_pom_chain(artifact.get("parent"), result)
-    _extract_pom_chain(artifact.get("parentPom"), result)
-    _extract_pom_chain(artifact.get("pom"), result)
+    while stack:
+        node, is_artifact = stack.pop()
+        if not is_artifact and (not node or not isinstance(node, dict)):
+            continue
 
-    for bom in artifact.get("boms", []):
-        _extract_pom_chain(bom, result)
+        result.append(MavenArtifact.model_validate(node))
 
-    for child in artifact.get("children", []):
-        _extract_artifact(child, result)
+        if is_artifact:
+            poms = [node.get("parent"), node.get("parentPom"), node.get("pom")]
+            children = [*node.get("children", []), *node.get("dependencies", [])]
+        else:
+            poms = [node.get("parent")]
+            children = []
+        poms.extend(node.get("boms", []))
 
-    for dep in artifact.get("dependencies", []):
-        _extract_artifact(dep, result)
+        # the stack is LIFO, push in reverse to keep the visiting order
+        stack.extend((child, True) for child in reversed(children))
+        stack.extend((pom, False) for pom in reversed(poms))
 
 
 def _parse_dependencies(lockfile: MavenLockfile) -> list[MavenArtifact]:
     """Parse the dependencies from the lockfile."""
     result: list[MavenArtifact] = []
-    for dependency in lockfile.dependencies:
-        _extract_artifact(dependency, result)
-
+    _extract_artifacts(lockfile.dependencies, result)
     return result
 
 
 def _parse_plugins(lockfile: MavenLockfile) -> list[MavenArtifact]:
     """Parse the Maven plugins from the lockfile."""
     result: list[MavenArtifact] = []
-    for plugin in lockfile.maven_plugins:
-        _extract_artifact(plugin, result)
-
+    _extract_artifacts(lockfile.maven_plugins, result)
     return result
 
 
@@ -153,11 +152,10 @@ def _parse_root_pom(lockfile: MavenLockfile) -> list[MavenArtifact]:
     result: list[MavenArtifact] = []
     root_pom = lockfile.pom.get("parent")
     if root_pom is not None:
-        _extract_artifact(root_pom, result)
+        _extract_artifacts([root_pom], result)
 
     boms = lockfile.pom.get("boms", [])
-    for bom in boms:
-        _extract_artifact(bom, result)
+    _extract_artifacts(boms, result)
 
     return result
 
@@ -0,0 +1,18 @@
+# SPDX-License-Identifier: GPL-3.0-only
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+
+def safe_load_yaml(stream: str | bytes | IO[str] | IO[bytes]) -> Any:
+    """Parse a single YAML document, using the libyaml-backed safe loader when available.
+
+    This module must not import anything from hermeto, hermeto.core.config depends on it.
+    """
+    # Both loader variants are safe loaders, ruff just cannot follow the conditional import
+    return yaml.load(stream, Loader=_SafeLoader)  # noqa: S506
@@ -1,9 +1,20 @@
 # SPDX-License-Identifier: GPL-3.0-only
+import hashlib
+import threading
+import time
 from pathlib import Path
+from typing import Any
+from unittest import mock
 
+import aiofiles
+import pytest
+
+from hermeto.core.errors import ChecksumVerificationFailed
 from hermeto.core.package_managers.maven.main import (
     MIRROR_ID,
+    _download_maven_artifacts,
     _get_matching_pom_files,
+    _verify_checksums,
     _write_remote_repositories_files,
 )
 from hermeto.core.package_managers.maven.models import MavenArtifact
@@ -26,6 +37,24 @@ def test_get_matching_pom_files(tmp_path: Path) -> None:
     assert url == "https://repo.maven.apache.org/maven2/g/a/1/a-1.pom"
 
 
+def test_get_matching_pom_files_replaces_only_url_path_filename(tmp_path: Path) -> None:
+    ma = MavenArtifact.model_validate(
+        {
+            "groupId": "g",
+            "artifactId": "a",
+            "version": "1",
+            "checksumAlgorithm": "SHA-256",
+            "checksum": "abcdef",
+            "resolved": "https://mirror.example.com/g/a/1/a-1.jar?download=a-1.jar",
+            "scope": "compile",
+        }
+    )
+    poms = _get_matching_pom_files(tmp_path, [ma])
+    assert poms == {
+        "https://mirror.example.com/g/a/1/a-1.pom?download=a-1.jar": tmp_path / "g/a/1/a-1.pom"
+    }
+
+
 def test_write_remote_repositories_files(tmp_path: Path) -> None:
     ma = MavenArtifact.model_validate(
         {
@@ -44,3 +73,172 @@ def test_write_remote_repositories_files(tmp_path: Path) -> None:
     _write_remote_repositories_files(tmp_path, [ma])
     text = ma_dir.joinpath("_remote.repositories").read_text()
     assert f"a-1.jar>{MIRROR_ID}=" in text
+
+
+def test_write_remote_repositories_files_shared_directory(tmp_path: Path) -> None:
+    artifacts = [
+        MavenArtifact.model_validate(
+            {
+                "groupId": "g",
+                "artifactId": "a",
+                "version": "1",
+                "checksumAlgorithm": "SHA-256",
+                "checksum": checksum,
+                "resolved": f"https://repo.maven.apache.org/maven2/g/a/1/{filename}",
+                "scope": "compile",
+            }
+        )
+        for filename, checksum in (
+            ("a-1.jar", "abcdef"),
+            ("a-1-sources.jar", "abcdef"),
+            ("a-1.jar", "fedcba"),
+        )
+    ]
+    ma_dir = tmp_path.joinpath("g", "a", "1")
+    ma_dir.mkdir(parents=True)
+
+    _write_remote_repositories_files(tmp_path, artifacts)
+    text = ma_dir.joinpath("_remote.repositories").read_text()
+    assert text == f"a-1-sources.jar>{MIRROR_ID}=\na-1.jar>{MIRROR_ID}=\n"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("corrupted", [False, True])
+async def test_verify_checksums(tmp_path: Path, corrupted: bool) -> None:
+    artifacts = [
+        MavenArtifact.model_validate(
+            {
+                "groupId": "g",
+                "artifactId": name,
+                "version": "1",
+                "checksumAlgorithm": "SHA-256",
+                "checksum": hashlib.sha256(name.encode()).hexdigest(),
+                "resolved": f"https://repo.maven.apache.org/maven2/g/{name}/1/{name}-1.jar",
+            }
+        )
+        for name in ("a", "b", "c")
+    ]
+    download_paths = {}
+    for artifact in artifacts:
+        download_paths[artifact.url] = tmp_path / artifact.filename
+        download_paths[artifact.url].write_text(artifact.artifact_id)
+
+    if corrupted:
+        download_paths[artifacts[1].url].write_text("corrupted")
+        with pytest.raises(ChecksumVerificationFailed):
+            await _verify_checksums(artifacts, download_paths)
+    else:
+        await _verify_checksums(artifacts, download_paths)
+
+
+@pytest.mark.asyncio
+@mock.patch("hermeto.core.package_managers.maven.main.must_match_any_checksum")
+@mock.patch("hermeto.core.package_managers.maven.main.get_config")
+async def test_verify_checksums_respects_concurrency_limit(
+    mock_get_config: mock.Mock, mock_must_match_any_checksum: mock.Mock, tmp_path: Path
+) -> None:
+    mock_get_config.return_value.runtime.concurrency_limit = 2
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def mock_verify(*args: Any) -> None:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    mock_must_match_any_checksum.side_effect = mock_verify
+    artifacts = [
+        MavenArtifact.model_validate(
+            {
+                "groupId": "g",
+                "artifactId": f"a{i}",
+                "version": "1",
+                "checksumAlgorithm": "SHA-256",
+                "checksum": "abcdef",
+                "resolved": f"https://repo.maven.apache.org/maven2/g/a{i}/1/a{i}-1.jar",
+            }
+        )
+        for i in range(6)
+    ]
+
+    await _verify_checksums(artifacts, {a.url: tmp_path / a.filename for a in artifacts})
+
+    assert mock_must_match_any_checksum.call_count == 6
+    assert max_running == 2
+
+
+@mock.patch("hermeto.core.package_managers.maven.main.async_download_files")
+def test_download_maven_artifacts(mock_download_files: mock.MagicMock, tmp_path: Path) -> None:
+    async def mock_async_download_files(files_to_download: dict[str, Path], _: int) -> None:
+        for url, path in files_to_download.items():
+            path.write_text(url)
+
+    mock_download_files.side_effect = mock_async_download_files
+
+    url = "https://repo.maven.apache.org/maven2/g/a/1/a-1.jar"
+    ma = MavenArtifact.model_validate(
+        {
+            "groupId": "g",
+            "artifactId": "a",
+            "version": "1",
+            "checksumAlgorithm": "SHA-256",
+            "checksum": hashlib.sha256(url.encode()).hexdigest(),
+            "resolved": url,
+            "scope": "compile",
+        }
+    )
+
+    _download_maven_artifacts(tmp_path, [ma])
+
+    ma_dir = tmp_path.joinpath("g", "a", "1")
+    assert ma_dir.joinpath("a-1.jar").read_text() == url
+    assert ma_dir.joinpath("a-1.pom").exists()
+    assert ma_dir.joinpath("a-1.jar.sha256").read_text() == ma.checksum
+
+
+@mock.patch("hermeto.core.package_managers.maven.main.must_match_any_checksum")
+@mock.patch("hermeto.core.package_managers.maven.main.async_download_files")
+def test_download_maven_artifacts_writes_poms_while_hashing(
+    mock_download_files: mock.MagicMock, mock_must_match_any_checksum: mock.Mock, tmp_path: Path
+) -> None:
+    poms_written = threading.Event()
+
+    async def mock_async_download_files(files_to_download: dict[str, Path], _: int) -> None:
+        for url, path in files_to_download.items():
+            # like the real downloads, aiofiles writes through the default executor
+            async with aiofiles.open(path, "w") as f:
+                await f.write(url)
+        if all(path.suffix == ".pom" for path in files_to_download.values()):
+            poms_written.set()
+
+    def mock_verify(*args: Any) -> None:
+        if not poms_written.wait(timeout=5):
+            raise AssertionError("POM downloads were stuck behind checksum verification")
+
+    mock_download_files.side_effect = mock_async_download_files
+    mock_must_match_any_checksum.side_effect = mock_verify
+
+    # more artifacts than the default executor has workers
+    artifacts = [
+        MavenArtifact.model_validate(
+            {
+                "groupId": "g",
+                "artifactId": f"a{i}",
+                "version": "1",
+                "checksumAlgorithm": "SHA-256",
+                "checksum": "abcdef",
+                "resolved": f"https://repo.maven.apache.org/maven2/g/a{i}/1/a{i}-1.jar",
+            }
+        )
+        for i in range(64)
+    ]
+
+    _download_maven_artifacts(tmp_path, artifacts)
+
+    assert mock_must_match_any_checksum.call_count == len(artifacts)
+    assert tmp_path.joinpath("g", "a0", "1", "a0-1.pom").exists()
@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: GPL-3.0-only
 import json
+import sys
 from pathlib import Path
+from typing import Any
 
 from hermeto.core.package_managers.maven.models import MavenLockfile, parse_maven_artifacts
 
@@ -43,3 +45,37 @@ def test_parse_deduplicates_identical_artifacts(tmp_path: Path) -> None:
     lockfile = MavenLockfile.from_file(lockfile_path)
     artifacts = parse_maven_artifacts(lockfile)
     assert {a.url for a in artifacts} == {shared_url, plugin_url}
+
+
+def test_parse_deeply_nested_dependencies() -> None:
+    depth = sys.getrecursionlimit() + 100
+
+    dependency: dict[str, Any] = {}
+    root = dependency
+    for i in range(depth):
+        dependency.update(
+            {
+                "groupId": "g",
+                "artifactId": f"a{i}",
+                "version": "1",
+                "checksumAlgorithm": "SHA-256",
+                "checksum": "abcdef",
+                "resolved": f"https://repo.maven.apache.org/maven2/g/a{i}/1/a{i}-1.jar",
+            }
+        )
+        if i < depth - 1:
+            child: dict[str, Any] = {}
+            dependency["children"] = [child]
+            dependency = child
+
+    lockfile = MavenLockfile.model_validate(
+        {
+            "groupId": "root",
+            "artifactId": "root",
+            "version": "1",
+            "pom": {},
+            "dependencies": [root],
+            "mavenPlugins": [],
+        }
+    )
+    assert len(parse_maven_artifacts(lockfile)) == depth
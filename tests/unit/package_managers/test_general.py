@@ -283,3 +283,72 @@ async def test_async_download_preserves_redirect_url_encoding(tmp_path: Path) ->
         download_path = tmp_path / "artifact"
         await async_download_files({url: str(download_path)}, concurrency_limit=1)
         assert b"text%2Fplain" in download_path.read_bytes()
+
+
+@pytest.mark.asyncio
+@mock.patch("hermeto.core.package_managers.general._async_download_binary_file")
+async def test_async_download_files_respects_concurrency_limit(
+    mock_download_file: MagicMock,
+    tmp_path: Path,
+) -> None:
+    running = 0
+    max_running = 0
+
+    async def mock_download_binary_file(*args: Any, **kwargs: Any) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    mock_download_file.side_effect = mock_download_binary_file
+    files_to_download = {f"file{i}": str(tmp_path / f"path{i}") for i in range(10)}
+
+    await async_download_files(files_to_download, concurrency_limit=3)
+
+    assert mock_download_file.call_count == 10
+    assert max_running == 3
+
+
+@pytest.mark.asyncio
+@mock.patch("hermeto.core.package_managers.general._async_download_binary_file")
+async def test_async_download_files_cancels_pending_on_failure(
+    mock_download_file: MagicMock,
+    tmp_path: Path,
+) -> None:
+    async def mock_download_binary_file(session: Any, url: str, *args: Any, **kwargs: Any) -> None:
+        if url == "file0":
+            raise FetchError(f"Could not download {url}")
+        await asyncio.sleep(10)
+
+    mock_download_file.side_effect = mock_download_binary_file
+    files_to_download = {f"file{i}": str(tmp_path / f"path{i}") for i in range(5)}
+
+    with pytest.raises(FetchError):
+        await asyncio.wait_for(async_download_files(files_to_download, concurrency_limit=2), 5)
+
+    # file0 fails right away while file1 is running. Releasing file0's semaphore slot lets file2
+    # start before the failure propagates; file3 and file4 are cancelled before they start.
+    assert mock_download_file.call_count == 3
+
+
+@pytest.mark.asyncio
+@mock.patch("hermeto.core.package_managers.general._get_aiohttp_timeout")
+@mock.patch("hermeto.core.package_managers.general._async_download_binary_file")
+async def test_async_download_files_shares_timeout(
+    mock_download_file: MagicMock,
+    mock_get_timeout: MagicMock,
+    tmp_path: Path,
+) -> None:
+    async def mock_download_binary_file(*args: Any, **kwargs: Any) -> None:
+        pass
+
+    mock_download_file.side_effect = mock_download_binary_file
+    files_to_download = {f"file{i}": str(tmp_path / f"path{i}") for i in range(3)}
+
+    await async_download_files(files_to_download, concurrency_limit=2)
+
+    mock_get_timeout.assert_called_once_with()
+    assert mock_download_file.call_count == 3
+    for call in mock_download_file.mock_calls:
+        assert call.kwargs["timeout"] is mock_get_timeout.return_value
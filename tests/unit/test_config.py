@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: GPL-3.0-only
+import os
 from pathlib import Path
 from typing import Any, Generator
+from unittest import mock
 
 import pytest
 import yaml
@@ -118,3 +120,61 @@ def test_cli_config_file_overrides_defaults(tmp_home_cwd: Path) -> None:
 
     config = config_module.get_config()
     assert config.runtime.concurrency_limit == cli_concurrency
+
+
+def test_load_yaml_cached_reuses_parsed_data(tmp_path: Path) -> None:
+    """Test that an unchanged file is parsed once and callers get independent copies."""
+    config_path = tmp_path / "config.yaml"
+    _write_yaml_config(config_path, {"runtime": {"concurrency_limit": 1}})
+
+    with mock.patch.object(
+        config_module, "safe_load_yaml", wraps=config_module.safe_load_yaml
+    ) as mock_load:
+        first = config_module._load_yaml_cached(config_path)
+        first["runtime"].pop("concurrency_limit")
+        second = config_module._load_yaml_cached(config_path)
+
+    assert mock_load.call_count == 1
+    assert second == {"runtime": {"concurrency_limit": 1}}
+
+
+def test_load_yaml_cached_reparses_modified_file(tmp_path: Path) -> None:
+    """Test that a file is parsed again once its size or mtime changes."""
+    config_path = tmp_path / "config.yaml"
+    _write_yaml_config(config_path, {"runtime": {"concurrency_limit": 1}})
+    assert config_module._load_yaml_cached(config_path) == {"runtime": {"concurrency_limit": 1}}
+
+    _write_yaml_config(config_path, {"runtime": {"concurrency_limit": 10}})
+    assert config_module._load_yaml_cached(config_path) == {"runtime": {"concurrency_limit": 10}}
+
+
+def test_load_yaml_cached_reparses_same_size_rewrite(tmp_path: Path) -> None:
+    """Test that a rewrite keeping the file size is detected through the new mtime."""
+    config_path = tmp_path / "config.yaml"
+    _write_yaml_config(config_path, {"runtime": {"concurrency_limit": 1}})
+    mtime_ns = config_path.stat().st_mtime_ns
+    assert config_module._load_yaml_cached(config_path) == {"runtime": {"concurrency_limit": 1}}
+
+    _write_yaml_config(config_path, {"runtime": {"concurrency_limit": 2}})
+    os.utime(config_path, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+    assert config_module._load_yaml_cached(config_path) == {"runtime": {"concurrency_limit": 2}}
+
+
+def test_yaml_settings_source_honours_file_encoding(tmp_path: Path) -> None:
+    """Test that the cached settings source reads files with the configured encoding."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("runtime:\n  concurrency_limit: 3  # poznámka\n", encoding="cp1250")
+
+    source = config_module._CachedYamlConfigSettingsSource(
+        config_module.Config, yaml_file=config_path, yaml_file_encoding="cp1250"
+    )
+
+    assert source._read_file(config_path) == {"runtime": {"concurrency_limit": 3}}
+
+
+def test_cli_config_class_is_reused_for_same_path(tmp_path: Path) -> None:
+    """Test that the CLI config subclass is only created once per config file path."""
+    first = config_module.create_cli_config_class(tmp_path / "a.yaml")
+
+    assert config_module.create_cli_config_class(tmp_path / "a.yaml") is first
+    assert config_module.create_cli_config_class(tmp_path / "b.yaml") is not first
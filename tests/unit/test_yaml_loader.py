@@ -0,0 +1,16 @@
+# SPDX-License-Identifier: GPL-3.0-only
+import pytest
+import yaml
+
+from hermeto.core.yaml_loader import safe_load_yaml
+
+
+def test_safe_load_yaml() -> None:
+    assert safe_load_yaml(b"runtime:\n  concurrency_limit: 3\n") == {
+        "runtime": {"concurrency_limit": 3}
+    }
+
+
+def test_safe_load_yaml_rejects_python_objects() -> None:
+    with pytest.raises(yaml.constructor.ConstructorError):
+        safe_load_yaml("!!python/object/apply:os.getcwd []")